@@ -22,6 +22,28 @@ from django.utils import timezone
 from economy.models import ConversionRate
 from gas.models import GasProfile
 
+BATCH_SIZE = 10000
+
+
+def delete_in_batches(queryset, batch_size=BATCH_SIZE):
+    """Delete the rows matched by queryset in pk windows of batch_size.
+
+    Neither model cleaned up here has FKs pointing at it or delete signals
+    attached, so each window skips the collector and is a single DELETE.
+    Keeping the windows small bounds the lock time of every statement.
+    """
+    model = queryset.model
+    deleted = 0
+    while True:
+        pks = list(queryset.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            break
+        batch = model.objects.filter(pk__in=pks)
+        batch._raw_delete(batch.db)
+        deleted += len(pks)
+        print(f'- deleted {deleted} {model.__name__} rows')
+    return deleted
+
 
 class Command(BaseCommand):
 
@@ -32,5 +54,9 @@ class Command(BaseCommand):
         days_back = 7
         then_time = timezone.now() - timezone.timedelta(days=days_back)
 
-        GasProfile.objects.filter(created_on__lt=then_time).delete()
-        ConversionRate.objects.filter(created_on__lt=then_time).exclude(from_currency='ETH', to_currency='USDT').exclude(from_currency='USDT', to_currency='ETH').delete()
+        delete_in_batches(GasProfile.objects.filter(created_on__lt=then_time))
+        delete_in_batches(
+            ConversionRate.objects.filter(created_on__lt=then_time)
+            .exclude(from_currency='ETH', to_currency='USDT')
+            .exclude(from_currency='USDT', to_currency='ETH')
+        )
@@ -0,0 +1,27 @@
+"""Define an expression index backing Profile.handle__iexact lookups.
+
+On PostgreSQL, Django compiles ``handle__iexact`` to
+``UPPER("dashboard_profile"."handle"::text) = UPPER(%s)``, which the plain
+btree on ``handle`` cannot serve.  The index expression below matches that
+left-hand side exactly so the planner can use it.
+
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0065_auto_20180504_2110'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_profile_handle_upper_idx '
+                'ON dashboard_profile (UPPER(handle::text));',
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS dashboard_profile_handle_upper_idx;',
+        ),
+    ]
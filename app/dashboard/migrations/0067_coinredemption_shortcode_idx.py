@@ -0,0 +1,36 @@
+"""Define an index on CoinRedemption.shortcode, built without locking writes.
+
+The AlterField only updates migration state; the index itself is created
+with CREATE INDEX CONCURRENTLY, matching 0066_profile_handle_upper_idx.
+
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0066_profile_handle_upper_idx'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='coinredemption',
+                    name='shortcode',
+                    field=models.CharField(db_index=True, default='', max_length=255),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_coinredemption_shortcode_idx '
+                        'ON dashboard_coinredemption (shortcode);',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS dashboard_coinredemption_shortcode_idx;',
+                ),
+            ],
+        ),
+    ]
@@ -1227,7 +1227,7 @@ class CoinRedemption(SuperModel):
 
         verbose_name_plural = 'Coin Redemptions'
 
-    shortcode = models.CharField(max_length=255, default='')
+    shortcode = models.CharField(max_length=255, default='', db_index=True)
     url = models.URLField(null=True)
     network = models.CharField(max_length=255, default='')
     token_name = models.CharField(max_length=255)
@@ -1241,7 +1241,6 @@ def to_checksum_address(sender, instance, **kwargs):
     """Handle pre-save signals from CoinRemptions to normalize the contract address."""
     if instance.contract_address:
         instance.contract_address = Web3.toChecksumAddress(instance.contract_address)
-        print(instance.contract_address)
 
 
 class CoinRedemptionRequest(SuperModel):
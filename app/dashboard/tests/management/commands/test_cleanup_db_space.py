@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Handle dashboard cleanup_db_space command related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from dashboard.management.commands.cleanup_db_space import Command, delete_in_batches
+from economy.models import ConversionRate
+from gas.models import GasProfile
+from test_plus.test import TestCase
+
+
+def gas_profile(created_on):
+    return GasProfile(
+        gas_price=1,
+        mean_time_to_confirm_blocks=1,
+        mean_time_to_confirm_minutes=1,
+        _99confident_confirm_time_blocks=1,
+        _99confident_confirm_time_mins=1,
+        created_on=created_on,
+    )
+
+
+def conversion_rate(from_currency, to_currency, created_on):
+    return ConversionRate(
+        from_amount=1,
+        to_amount=2,
+        source='etherdelta',
+        from_currency=from_currency,
+        to_currency=to_currency,
+        created_on=created_on,
+    )
+
+
+class TestCleanupDbSpace(TestCase):
+    """Define tests for cleanup db space."""
+
+    def setUp(self):
+        """Perform setup for the testcase."""
+        self.old = timezone.now() - timedelta(days=8)
+        self.recent = timezone.now() - timedelta(days=1)
+
+    def test_delete_in_batches(self):
+        """Test delete_in_batches removes matching rows over several batches."""
+        GasProfile.objects.bulk_create([gas_profile(self.old) for _ in range(5)])
+        recent_profiles = GasProfile.objects.bulk_create([gas_profile(self.recent) for _ in range(2)])
+        then_time = timezone.now() - timedelta(days=7)
+
+        # one pk scan and one delete per batch of 2, then an empty scan
+        with self.assertNumQueries(7):
+            deleted = delete_in_batches(GasProfile.objects.filter(created_on__lt=then_time), batch_size=2)
+
+        assert deleted == 5
+        assert set(GasProfile.objects.values_list('pk', flat=True)) == {gp.pk for gp in recent_profiles}
+
+    def test_handle(self):
+        """Test command cleanup db space."""
+        GasProfile.objects.bulk_create([gas_profile(self.old), gas_profile(self.recent)])
+        # bulk_create skips the reverse rate post_save receiver
+        ConversionRate.objects.bulk_create([
+            conversion_rate('ETH', 'USDT', self.old),
+            conversion_rate('USDT', 'ETH', self.old),
+            conversion_rate('ETH', 'BTC', self.old),
+            conversion_rate('ETH', 'BTC', self.recent),
+        ])
+
+        Command().handle()
+
+        assert list(GasProfile.objects.values_list('created_on', flat=True)) == [self.recent]
+        remaining_rates = ConversionRate.objects.values_list('from_currency', 'to_currency', 'created_on')
+        assert set(remaining_rates) == {
+            ('ETH', 'USDT', self.old),
+            ('USDT', 'ETH', self.old),
+            ('ETH', 'BTC', self.recent),
+        }
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Handle dashboard view related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+from unittest.mock import patch
+
+from django.test.client import RequestFactory
+from django.utils import timezone
+
+from dashboard.models import CoinRedemption, CoinRedemptionRequest
+from dashboard.views import redeem_coin
+from test_plus.test import TestCase
+
+
+class DashboardViewsTest(TestCase):
+    """Define tests for dashboard views."""
+
+    def setUp(self):
+        """Perform setup for the testcase."""
+        self.factory = RequestFactory()
+        self.address = '0x0000000000000000000000000000000000000001'
+        self.coin = CoinRedemption.objects.create(
+            shortcode='abc123',
+            network='mainnet',
+            token_name='COLO',
+            contract_address='0x0000000000000000000000000000000000000002',
+            amount=1,
+            expires_date=timezone.now() + timezone.timedelta(days=1),
+        )
+
+    def create_redemption_request(self):
+        return CoinRedemptionRequest.objects.create(
+            coin_redemption=self.coin,
+            ip='127.0.0.1',
+            txid='0xdeadbeef',
+            txaddress=self.address,
+        )
+
+    def test_redeem_coin_get_without_request(self):
+        """Test the redeem_coin view reports an unredeemed coin in a single query."""
+        request = self.factory.get('/coin/redeem/abc123')
+        with self.assertNumQueries(1):
+            response = redeem_coin(request, 'abc123')
+        assert response.context_data['coin_status'] == 'INITIAL'
+        assert 'colo_txid' not in response.context_data
+
+    def test_redeem_coin_get_with_request(self):
+        """Test the redeem_coin view reports a pending redemption in a single query."""
+        self.create_redemption_request()
+        request = self.factory.get('/coin/redeem/abc123')
+        with self.assertNumQueries(1):
+            response = redeem_coin(request, 'abc123')
+        assert response.context_data['coin_status'] == 'PENDING'
+        assert response.context_data['colo_txid'] == '0xdeadbeef'
+
+    @patch('dashboard.views.w3')
+    def test_redeem_coin_post_without_request(self, mock_w3):
+        """Test the redeem_coin view sends the coin when it has not been redeemed."""
+        mock_w3.eth.sendRawTransaction.return_value.hex.return_value = '0xfeedface'
+        request = self.factory.post(
+            '/coin/redeem/abc123', json.dumps({'address': self.address}), content_type='application/json')
+        response = json.loads(redeem_coin(request, 'abc123').content)
+        assert response == {'status': 'OK', 'message': '0xfeedface'}
+        assert CoinRedemptionRequest.objects.get(coin_redemption=self.coin).txid == '0xfeedface'
+
+    @patch('dashboard.views.w3')
+    def test_redeem_coin_post_with_request(self, mock_w3):
+        """Test the redeem_coin view refuses to send a coin twice."""
+        self.create_redemption_request()
+        request = self.factory.post(
+            '/coin/redeem/abc123', json.dumps({'address': self.address}), content_type='application/json')
+        response = json.loads(redeem_coin(request, 'abc123').content)
+        assert response == {'status': 'error', 'message': 'Bad request'}
+        assert not mock_w3.eth.sendRawTransaction.called
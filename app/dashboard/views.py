@@ -85,7 +85,7 @@ def record_user_action(user, event_name, instance):
         kwargs['user'] = user
     elif isinstance(user, str):
         try:
-            user = User.objects.get(username=user)
+            user = User.objects.select_related('profile').get(username=user)
             kwargs['user'] = user
         except User.DoesNotExist:
             return
@@ -417,7 +417,7 @@ def send_tip_2(request):
         elif access_token and not primary_from_email:
             primary_from_email = get_github_primary_email(access_token)
 
-        to_emails = list(set(to_emails))
+        to_emails = list(dict.fromkeys(to_emails))
         expires_date = timezone.now() + timezone.timedelta(seconds=params['expires_date'])
 
         # db mutations
@@ -672,7 +672,6 @@ def bounty_details(request, ghuser='', ghrepo='', ghissue=0, stdbounties_id=None
         assert Bounty.objects.current().filter(github_url=issue_url).exists()
     except Exception:
         issue_url = 'https://github.com/' + ghuser + '/' + ghrepo + '/pull/' + ghissue if ghissue else request.GET.get('url')
-        print(issue_url)
 
     params = {
         'issueURL': issue_url,
@@ -709,7 +708,6 @@ def bounty_details(request, ghuser='', ghrepo='', ghissue=0, stdbounties_id=None
         except Bounty.DoesNotExist:
             pass
         except Exception as e:
-            print(e)
             logging.error(e)
 
     return TemplateResponse(request, 'bounty_details.html', params)
@@ -722,27 +720,25 @@ def profile_helper(handle):
         handle (str): The profile handle.
 
     Raises:
-        DoesNotExist: The exception is raised if a Profile isn't found matching the handle.
-            Remediation is attempted by syncing the profile data.
-        MultipleObjectsReturned: The exception is raised if multiple Profiles are found.
-            The latest Profile will be returned.
+        Http404: The exception is raised if a Profile isn't found matching the handle
+            and remediation by syncing the profile data fails.
 
     Returns:
         dashboard.models.Profile: The Profile associated with the provided handle.
+            If multiple Profiles exist for the same handle, the latest is returned.
 
     """
-    try:
-        profile = Profile.objects.get(handle__iexact=handle)
-    except Profile.DoesNotExist:
+    # Handle edge case where multiple Profile objects exist for the same handle.
+    # We should consider setting Profile.handle to unique.
+    # TODO: Should we handle merging or removing duplicate profiles?
+    profiles = list(Profile.objects.filter(handle__iexact=handle).order_by('-id')[:2])
+    if len(profiles) > 1:
+        logging.error(f'Multiple Profiles found for handle: {handle}')
+    profile = profiles[0] if profiles else None
+    if not profile:
         profile = sync_profile(handle)
         if not profile:
             raise Http404
-    except Profile.MultipleObjectsReturned as e:
-        # Handle edge case where multiple Profile objects exist for the same handle.
-        # We should consider setting Profile.handle to unique.
-        # TODO: Should we handle merging or removing duplicate profiles?
-        profile = Profile.objects.filter(handle__iexact=handle).latest('id')
-        logging.error(e)
     return profile
 
 
@@ -1052,7 +1048,7 @@ def redeem_coin(request, shortcode):
         address = body['address']
 
         try:
-            coin = CoinRedemption.objects.get(shortcode=shortcode)
+            coin = CoinRedemption.objects.select_related('coinredemptionrequest').get(shortcode=shortcode)
             address = Web3.toChecksumAddress(address)
 
             if hasattr(coin, 'coinredemptionrequest'):
@@ -1098,7 +1094,7 @@ def redeem_coin(request, shortcode):
         return JsonResponse(response)
 
     try:
-        coin = CoinRedemption.objects.get(shortcode=shortcode)
+        coin = CoinRedemption.objects.select_related('coinredemptionrequest').get(shortcode=shortcode)
 
         params = {
             'class': 'redeem',
@@ -1106,10 +1102,9 @@ def redeem_coin(request, shortcode):
             'coin_status': _('PENDING')
         }
 
-        try:
-            coin_redeem_request = CoinRedemptionRequest.objects.get(coin_redemption=coin)
-            params['colo_txid'] = coin_redeem_request.txid
-        except CoinRedemptionRequest.DoesNotExist:
+        if hasattr(coin, 'coinredemptionrequest'):
+            params['colo_txid'] = coin.coinredemptionrequest.txid
+        else:
             params['coin_status'] = _('INITIAL')
 
         return TemplateResponse(request, 'yge/redeem_coin.html', params)
@@ -20,6 +20,7 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 from django.test.client import RequestFactory
 
 from economy.models import ConversionRate
+from gas import utils as gas_utils
 from gas.models import GasProfile
 from gas.utils import (
     conf_time_spread, eth_usd_conv_rate, gas_price_to_confirm_time_minutes, recommend_min_gas_price_to_confirm_in_time,
@@ -32,6 +33,7 @@ class GasUtilsTest(TestCase):
 
     def setUp(self):
         """Perform setup for the testcase."""
+        gas_utils._recommended_gas_prices.clear()
         self.factory = RequestFactory()
         GasProfile.objects.create(
             gas_price=1,
@@ -66,6 +68,15 @@ class GasUtilsTest(TestCase):
         """Test the gas util recommend_min_gas_price_to_confirm_in_time method."""
         assert recommend_min_gas_price_to_confirm_in_time(5) == 2
 
+    def test_recommend_min_gas_price_to_confirm_in_time_is_cached(self):
+        """Test the gas util recommend_min_gas_price_to_confirm_in_time method memoizes its result."""
+        with self.assertNumQueries(1):
+            assert recommend_min_gas_price_to_confirm_in_time(5) == 2
+        with self.assertNumQueries(0):
+            assert recommend_min_gas_price_to_confirm_in_time(5) == 2
+        with self.assertNumQueries(1):
+            assert recommend_min_gas_price_to_confirm_in_time(2) == 3
+
     def test_gas_price_to_confirm_time_minutes(self):
         """Test the gas util gas_price_to_confirm_time_minutes method."""
         assert gas_price_to_confirm_time_minutes(2) == 4
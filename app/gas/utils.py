@@ -1,4 +1,5 @@
 import json
+import time
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
@@ -7,18 +8,32 @@ from economy.utils import convert_amount
 from gas.models import GasProfile
 
 
+# GasProfile rows are only refreshed by the sync_gas_prices job, so memoize
+# recommendations in-process for a short while instead of querying per page
+RECOMMEND_GAS_PRICE_CACHE_SECONDS = 30
+_recommended_gas_prices = {}
+
+
 def recommend_min_gas_price_to_confirm_in_time(minutes, default=5):
     # if settings.DEBUG:
     #     return 10
+    now = time.monotonic()
+    cached = _recommended_gas_prices.get(minutes)
+    if cached and now - cached[0] < RECOMMEND_GAS_PRICE_CACHE_SECONDS:
+        return cached[1]
+
     try:
         gp = GasProfile.objects.filter(
             created_on__gt=(timezone.now()-timezone.timedelta(minutes=31)),
             mean_time_to_confirm_minutes__lt=minutes
             ).order_by('gas_price').first()
-        return max(gp.gas_price, 1)
+        gas_price = max(gp.gas_price, 1)
     except Exception:
         return default
 
+    _recommended_gas_prices[minutes] = (now, gas_price)
+    return gas_price
+
 
 def gas_price_to_confirm_time_minutes(gas_price):
     gp = GasProfile.objects.get(
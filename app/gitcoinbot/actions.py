@@ -36,6 +36,12 @@ MIN_AMOUNT = 0
 CURRENCIES = set(map(lambda currency: currency['name'], tokens))
 FALLBACK_CURRENCY = 'ETH'
 
+HELP_REGEX = re.compile(r'@?[Gg]itcoinbot\s[Hh]elp')
+BOUNTY_REGEX = re.compile(r'@?[Gg]itcoinbot\s[Bb]ounty\s\d*\.?(\d+\s?)')
+SUBMIT_WORK_REGEX = re.compile(r'@?[Gg]itcoinbot\s[Ss]ubmit(\s[Ww]ork)?')
+TIP_REGEX = re.compile(r'@?[Gg]itcoinbot\s[Tt]ip\s@\w*\s\d*\.?(\d+\s?)')
+START_WORK_REGEX = re.compile(r'@?[Gg]itcoinbot\s[Ss]tart(\s[Ww]ork)?')
+
 
 class Bound:
     """Validate every bound before call the annotated function."""
@@ -224,28 +230,22 @@ def get_text_from_query_responses(comment_text, sender):
 
 
 def determine_response(owner, repo, comment_id, comment_text, issue_id, install_id, sender):
-    help_regex = r'@?[Gg]itcoinbot\s[Hh]elp'
-    bounty_regex = r'@?[Gg]itcoinbot\s[Bb]ounty\s\d*\.?(\d+\s?)'
-    submit_work_regex = r'@?[Gg]itcoinbot\s[Ss]ubmit(\s[Ww]ork)?'
-    tip_regex = r'@?[Gg]itcoinbot\s[Tt]ip\s@\w*\s\d*\.?(\d+\s?)'
-    start_work_regex = r'@?[Gg]itcoinbot\s[Ss]tart(\s[Ww]ork)?'
-
-    if re.match(help_regex, comment_text) is not None:
+    if HELP_REGEX.match(comment_text) is not None:
         post_issue_comment_reaction(owner, repo, comment_id, '+1')
         post_gitcoin_app_comment(owner, repo, issue_id, help_text(), install_id)
-    elif re.match(bounty_regex, comment_text) is not None:
+    elif BOUNTY_REGEX.match(comment_text) is not None:
         post_issue_comment_reaction(owner, repo, comment_id, '+1')
         bounty_text = new_bounty_text(owner, repo, issue_id, comment_text)
         post_gitcoin_app_comment(owner, repo, issue_id, bounty_text, install_id)
-    elif re.match(submit_work_regex, comment_text) is not None:
+    elif SUBMIT_WORK_REGEX.match(comment_text) is not None:
         post_issue_comment_reaction(owner, repo, comment_id, '+1')
         result_text = submit_work_or_new_bounty_text(owner, repo, issue_id)
         post_gitcoin_app_comment(owner, repo, issue_id, result_text, install_id)
-    elif re.match(tip_regex, comment_text) is not None:
+    elif TIP_REGEX.match(comment_text) is not None:
         post_issue_comment_reaction(owner, repo, comment_id, 'heart')
         tip_text = new_tip_text(owner, repo, issue_id, comment_text)
         post_gitcoin_app_comment(owner, repo, issue_id, tip_text, install_id)
-    elif re.match(start_work_regex, comment_text) is not None:
+    elif START_WORK_REGEX.match(comment_text) is not None:
         post_issue_comment_reaction(owner, repo, comment_id, 'heart')
         start_text = start_work_text(owner, repo, issue_id)
         post_gitcoin_app_comment(owner, repo, issue_id, start_text, install_id)